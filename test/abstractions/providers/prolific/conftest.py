@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+
+# Copyright (c) Facebook, Inc. and its affiliates.
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+from functools import lru_cache
+from functools import partial
+from typing import Callable
+
+import pytest
+
+from mephisto.abstractions.providers.prolific.api.client import ProlificClient
+from mephisto.abstractions.providers.prolific.prolific_utils import get_authenticated_client
+
+
+@pytest.fixture(scope="session")
+def get_prolific_client() -> Callable[[], ProlificClient]:
+    """
+    Getter of a Prolific client shared by the whole test session.
+    The client is authenticated on the first call, so tests that never use it skip that
+    """
+    return lru_cache(maxsize=None)(partial(get_authenticated_client, "prolific"))
+
+
+@pytest.fixture(scope="class")
+def prolific_client_class(request, get_prolific_client: Callable[[], ProlificClient]) -> None:
+    """Expose the session Prolific client getter to `unittest.TestCase` classes"""
+    request.cls._get_client = staticmethod(get_prolific_client)
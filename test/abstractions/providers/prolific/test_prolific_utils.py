@@ -4,18 +4,29 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import itertools
 import os
+import tempfile
 import unittest
+from contextlib import ExitStack
+from copy import copy
 from copy import deepcopy
 from dataclasses import dataclass
 from dataclasses import field
+from functools import lru_cache
+from types import MappingProxyType
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import DEFAULT
 from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
-from omegaconf import DictConfig
 
+from mephisto.abstractions.architects.ec2 import ec2_architect
+from mephisto.abstractions.providers.prolific import prolific_utils
 from mephisto.abstractions.providers.prolific.api import constants
+from mephisto.abstractions.providers.prolific.api.client import ProlificClient
 from mephisto.abstractions.providers.prolific.api.data_models import ParticipantGroup
 from mephisto.abstractions.providers.prolific.api.data_models import Project
 from mephisto.abstractions.providers.prolific.api.data_models import Study
@@ -23,6 +34,11 @@ from mephisto.abstractions.providers.prolific.api.data_models import User
 from mephisto.abstractions.providers.prolific.api.data_models import Workspace
 from mephisto.abstractions.providers.prolific.api.data_models import WorkspaceBalance
 from mephisto.abstractions.providers.prolific.api.exceptions import ProlificRequestError
+from mephisto.abstractions.providers.prolific.api.participant_groups import ParticipantGroups
+from mephisto.abstractions.providers.prolific.api.projects import Projects
+from mephisto.abstractions.providers.prolific.api.studies import Studies
+from mephisto.abstractions.providers.prolific.api.users import Users
+from mephisto.abstractions.providers.prolific.api.workspaces import Workspaces
 from mephisto.abstractions.providers.prolific.prolific_utils import (
     _convert_eligibility_requirements,
 )
@@ -43,7 +59,6 @@ from mephisto.abstractions.providers.prolific.prolific_utils import (
     find_or_create_prolific_workspace,
 )
 from mephisto.abstractions.providers.prolific.prolific_utils import find_or_create_qualification
-from mephisto.abstractions.providers.prolific.prolific_utils import get_authenticated_client
 from mephisto.abstractions.providers.prolific.prolific_utils import get_study
 from mephisto.abstractions.providers.prolific.prolific_utils import (
     increase_total_available_places_for_study,
@@ -54,8 +69,83 @@ from mephisto.abstractions.providers.prolific.prolific_utils import setup_creden
 from mephisto.abstractions.providers.prolific.prolific_utils import stop_study
 from mephisto.data_model.requester import RequesterArgs
 
-MOCK_PROLIFIC_CONFIG_DIR = "/tmp/"
-MOCK_PROLIFIC_CONFIG_PATH = "/tmp/test_conf_credentials"
+_MISSING = object()
+
+# Prolific-like 24-char IDs, generated once instead of calling `uuid4` in every test
+_FAKE_IDS = [uuid4().hex[:24] for _ in range(64)]
+_fake_ids = itertools.cycle(_FAKE_IDS)
+
+_FAKE_PROJECT_ID = "0" * 24
+_FAKE_STUDY_ID = "1" * 24
+
+# Error of a failed Prolific API call, raised by all tests. Besides its fixed `message` and
+# `status_code`, every raise leaves a `__traceback__` holding that test's frames, which
+# the next raise would extend. So it is only raised through `_raising`, which drops it first
+_PROLIFIC_ERROR = ProlificRequestError("Error")
+
+# Completion codes of a mocked Study, only read by the code under test
+_COMPLETION_CODES = [
+    dict(
+        code="test",
+        code_type="test",
+        actions=[
+            dict(
+                action="test",
+            )
+        ],
+    )
+]
+
+
+def _fake_id() -> str:
+    return next(_fake_ids)
+
+
+def _returning(value):
+    """Plain stand-in for an API call that always returns `value`"""
+    return lambda *args, **kwargs: value
+
+
+def _raising(exception):
+    """Plain stand-in for an API call that always raises `exception`"""
+
+    def _raise(*args, **kwargs):
+        # The same instance is raised again and again, so drop the traceback of its last raise
+        raise exception.with_traceback(None)
+
+    return _raise
+
+
+def _restore(target, attr, original):
+    if original is _MISSING:
+        delattr(target, attr)
+    else:
+        setattr(target, attr, original)
+
+
+def _given(**fields) -> dict:
+    return {name: value for name, value in fields.items() if value is not None}
+
+
+# Tests only read these data models, so the same instance is shared between them.
+# A test that needs to change an instance must build its own one
+@lru_cache(maxsize=None)
+def _workspace(*, id: Optional[str] = None, title: Optional[str] = None) -> Workspace:
+    return Workspace(**_given(id=id, title=title))
+
+
+@lru_cache(maxsize=None)
+def _project(*, id: Optional[str] = None, title: Optional[str] = None) -> Project:
+    return Project(**_given(id=id, title=title))
+
+
+@lru_cache(maxsize=None)
+def _participant_group(
+    *,
+    id: Optional[str] = None,
+    name: Optional[str] = None,
+) -> ParticipantGroup:
+    return ParticipantGroup(**_given(id=id, name=name))
 
 
 @dataclass
@@ -68,558 +158,471 @@ class MockProlificRequesterArgs(RequesterArgs):
     )
 
 
-mock_task_run_args = DictConfig(
-    dict(
-        architect=DictConfig(
-            dict(
-                _architect_type="local",
-            )
-        ),
-        task=DictConfig(
-            dict(
-                task_title="title",
-                task_description="This is a description",
-                task_reward=0.3,
-                task_tags="1,2,3",
-                task_lifetime_in_seconds=1,
-            )
-        ),
-        provider=DictConfig(
-            dict(
-                prolific_external_study_url=(
-                    "https://example.com?"
-                    "participant_id={{%PROLIFIC_PID%}}&"
-                    "study_id={{%STUDY_ID%}}&"
-                    "submission_id={{%SESSION_ID%}}"
-                ),
-                prolific_id_option="url_parameters",
-                prolific_workspace_name="My Workspace",
-                prolific_project_name="Project",
-                prolific_allow_list_group_name="Allow list",
-                prolific_block_list_group_name="Block list",
-                prolific_estimated_completion_time_in_minutes=60,
-            )
+# Code under test only reads attributes of the task run config,
+# so a plain namespace stands in for `DictConfig`
+mock_task_run_args = SimpleNamespace(
+    architect=SimpleNamespace(
+        _architect_type="local",
+    ),
+    task=SimpleNamespace(
+        task_title="title",
+        task_description="This is a description",
+        task_reward=0.3,
+        task_tags="1,2,3",
+        task_lifetime_in_seconds=1,
+    ),
+    provider=SimpleNamespace(
+        prolific_external_study_url=(
+            "https://example.com?"
+            "participant_id={{%PROLIFIC_PID%}}&"
+            "study_id={{%STUDY_ID%}}&"
+            "submission_id={{%SESSION_ID%}}"
         ),
-    )
+        prolific_id_option="url_parameters",
+        prolific_workspace_name="My Workspace",
+        prolific_project_name="Project",
+        prolific_allow_list_group_name="Allow list",
+        prolific_block_list_group_name="Block list",
+        prolific_estimated_completion_time_in_minutes=60,
+    ),
 )
 
+mock_task_run_args_ec2 = deepcopy(mock_task_run_args)
+mock_task_run_args_ec2.architect._architect_type = "ec2"
+
+
+# Short format of Eligibility Requirements, as passed in a task config
+_ELIG_INPUT = (
+    MappingProxyType(
+        {
+            "name": "AgeRangeEligibilityRequirement",
+            "min_age": 18,
+            "max_age": 100,
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "ApprovalNumbersEligibilityRequirement",
+            "minimum_approvals": 1,
+            "maximum_approvals": 100,
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "ApprovalRateEligibilityRequirement",
+            "minimum_approval_rate": 1,
+            "maximum_approval_rate": 100,
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "CustomBlacklistEligibilityRequirement",
+            "black_list": ["54ac6ea9fdf99b2204feb893"],
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "CustomWhitelistEligibilityRequirement",
+            "white_list": ["54ac6ea9fdf99b2204feb893"],
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "JoinedBeforeEligibilityRequirement",
+            "joined_before": "2023‐08‐08T00:00:00Z",
+        }
+    ),
+    MappingProxyType(
+        {
+            "name": "ParticipantGroupEligibilityRequirement",
+            "id": "54ac6ea9fdf99b2204feb893",
+        }
+    ),
+)
 
-@pytest.mark.prolific
-class TestProlificUtils(unittest.TestCase):
-    """Unit testing for Prolific Utils"""
+# The same Eligibility Requirements in Prolific format
+_ELIG_EXPECTED = (
+    MappingProxyType(
+        {
+            "_cls": "web.eligibility.models.AgeRangeEligibilityRequirement",
+            "attributes": [
+                {"name": "min_age", "value": 18},
+                {"name": "max_age", "value": 100},
+            ],
+            "query": {"id": "54ac6ea9fdf99b2204feb893"},
+        }
+    ),
+    MappingProxyType(
+        {
+            "_cls": "web.eligibility.models.ApprovalNumbersEligibilityRequirement",
+            "attributes": [
+                {"name": "minimum_approvals", "value": 1},
+                {"name": "maximum_approvals", "value": 100},
+            ],
+        }
+    ),
+    MappingProxyType(
+        {
+            "_cls": "web.eligibility.models.ApprovalRateEligibilityRequirement",
+            "attributes": [
+                {"name": "minimum_approval_rate", "value": 1},
+                {"name": "maximum_approval_rate", "value": 100},
+            ],
+        }
+    ),
+    MappingProxyType(
+        {
+            "_cls": "web.eligibility.models.CustomBlacklistEligibilityRequirement",
+            "attributes": [
+                {"name": "black_list", "value": ["54ac6ea9fdf99b2204feb893"]},
+            ],
+        }
+    ),
+    MappingProxyType(
+        {
+            "_cls": "web.eligibility.models.CustomWhitelistEligibilityRequirement",
+            "attributes": [
+                {"name": "white_list", "value": ["54ac6ea9fdf99b2204feb893"]},
+            ],
+        }
+    ),
+    MappingProxyType(
+        {
+            "_cls": "web.eligibility.models.JoinedBeforeEligibilityRequirement",
+            "attributes": [
+                {"name": "joined_before", "value": "2023‐08‐08T00:00:00Z"},
+            ],
+        }
+    ),
+    MappingProxyType(
+        {
+            "_cls": "web.eligibility.models.ParticipantGroupEligibilityRequirement",
+            "attributes": [
+                {"id": "54ac6ea9fdf99b2204feb893", "value": True},
+            ],
+        }
+    ),
+)
 
-    @classmethod
-    def setUpClass(cls):
-        super().setUpClass()
-        cls.client = get_authenticated_client("prolific")
 
-    @staticmethod
-    def remove_credentials_file():
-        if os.path.exists(MOCK_PROLIFIC_CONFIG_PATH):
-            os.remove(MOCK_PROLIFIC_CONFIG_PATH)
+class ProlificUtilsTestCase(unittest.TestCase):
+    """Base of the Prolific Utils test cases"""
+
+    @property
+    def client(self) -> ProlificClient:
+        """Authenticated Prolific client, created only once a test actually uses it"""
+        return self._get_client()
+
+    def setUp(self):
+        super().setUp()
+        # All replacements and patches made during a test are undone in one place
+        self._stack = ExitStack()
+        self.addCleanup(self._stack.close)
+
+    def _set(self, target, attr, value):
+        """
+        Replace `target.attr` with `value` until the end of the test.
+        Callables set on a class are wrapped into `staticmethod`, so they are not bound
+        """
+        self._stack.callback(_restore, target, attr, vars(target).get(attr, _MISSING))
+        if isinstance(target, type) and callable(value):
+            value = staticmethod(value)
+        setattr(target, attr, value)
 
-    @patch("mephisto.abstractions.providers.prolific.api.users.Users.me")
-    def test_check_credentials_true(self, mock_prolific_users_me, *args):
-        mock_prolific_users_me.return_value = User(id="test")
+    def _patch(self, target, attr, *args, **kwargs):
+        """Patch `target.attr` with `unittest.mock.patch.object` until the end of the test"""
+        return self._stack.enter_context(patch.object(target, attr, *args, **kwargs))
+
+
+@pytest.mark.prolific
+@pytest.mark.usefixtures("prolific_client_class")
+class TestProlificUtils(ProlificUtilsTestCase):
+    """Unit testing for Prolific Utils"""
+
+    def test_check_credentials_true(self, *args):
+        self._set(Users, "me", _returning(User(id="test")))
         result = check_credentials()
         self.assertTrue(result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.users.Users.me")
-    def test_check_credentials_false(self, mock_prolific_users_me, *args):
-        mock_prolific_users_me.side_effect = ProlificRequestError()
+    def test_check_credentials_false(self, *args):
+        self._set(Users, "me", _raising(_PROLIFIC_ERROR))
         result = check_credentials()
         self.assertFalse(result)
 
-    @patch(
-        "mephisto.abstractions.providers.prolific.prolific_utils.CREDENTIALS_CONFIG_DIR",
-        MOCK_PROLIFIC_CONFIG_DIR,
-    )
-    @patch(
-        "mephisto.abstractions.providers.prolific.prolific_utils.CREDENTIALS_CONFIG_PATH",
-        MOCK_PROLIFIC_CONFIG_PATH,
-    )
     def test_setup_credentials(self, *args):
-        self.remove_credentials_file()
-        self.assertFalse(os.path.exists(MOCK_PROLIFIC_CONFIG_PATH))
+        # Every test gets its own config dir, so tests running in parallel don't share the file
+        config_dir = self._stack.enter_context(tempfile.TemporaryDirectory())
+        config_path = os.path.join(config_dir, "test_conf_credentials")
+        self._set(prolific_utils, "CREDENTIALS_CONFIG_DIR", config_dir)
+        self._set(prolific_utils, "CREDENTIALS_CONFIG_PATH", config_path)
+        with self.assertRaises(FileNotFoundError):
+            os.stat(config_path)
         cfg = MockProlificRequesterArgs()
         setup_credentials("name", cfg)
-        self.assertTrue(os.path.exists(MOCK_PROLIFIC_CONFIG_PATH))
-        self.remove_credentials_file()
+        self.assertTrue(os.path.exists(config_path))
 
     def test__convert_eligibility_requirements(self, *args):
-        income_value = [
-            {
-                "name": "AgeRangeEligibilityRequirement",
-                "min_age": 18,
-                "max_age": 100,
-            },
-            {
-                "name": "ApprovalNumbersEligibilityRequirement",
-                "minimum_approvals": 1,
-                "maximum_approvals": 100,
-            },
-            {
-                "name": "ApprovalRateEligibilityRequirement",
-                "minimum_approval_rate": 1,
-                "maximum_approval_rate": 100,
-            },
-            {
-                "name": "CustomBlacklistEligibilityRequirement",
-                "black_list": ["54ac6ea9fdf99b2204feb893"],
-            },
-            {
-                "name": "CustomWhitelistEligibilityRequirement",
-                "white_list": ["54ac6ea9fdf99b2204feb893"],
-            },
-            {
-                "name": "JoinedBeforeEligibilityRequirement",
-                "joined_before": "2023‐08‐08T00:00:00Z",
-            },
-            {
-                "name": "ParticipantGroupEligibilityRequirement",
-                "id": "54ac6ea9fdf99b2204feb893",
-            },
-        ]
-        result = _convert_eligibility_requirements(income_value)
-        self.assertEqual(
-            result,
-            [
-                {
-                    "_cls": "web.eligibility.models.AgeRangeEligibilityRequirement",
-                    "attributes": [
-                        {"name": "min_age", "value": 18},
-                        {"name": "max_age", "value": 100},
-                    ],
-                    "query": {"id": "54ac6ea9fdf99b2204feb893"},
-                },
-                {
-                    "_cls": "web.eligibility.models.ApprovalNumbersEligibilityRequirement",
-                    "attributes": [
-                        {"name": "minimum_approvals", "value": 1},
-                        {"name": "maximum_approvals", "value": 100},
-                    ],
-                },
-                {
-                    "_cls": "web.eligibility.models.ApprovalRateEligibilityRequirement",
-                    "attributes": [
-                        {"name": "minimum_approval_rate", "value": 1},
-                        {"name": "maximum_approval_rate", "value": 100},
-                    ],
-                },
-                {
-                    "_cls": "web.eligibility.models.CustomBlacklistEligibilityRequirement",
-                    "attributes": [
-                        {"name": "black_list", "value": ["54ac6ea9fdf99b2204feb893"]},
-                    ],
-                },
-                {
-                    "_cls": "web.eligibility.models.CustomWhitelistEligibilityRequirement",
-                    "attributes": [
-                        {"name": "white_list", "value": ["54ac6ea9fdf99b2204feb893"]},
-                    ],
-                },
-                {
-                    "_cls": "web.eligibility.models.JoinedBeforeEligibilityRequirement",
-                    "attributes": [
-                        {"name": "joined_before", "value": "2023‐08‐08T00:00:00Z"},
-                    ],
-                },
-                {
-                    "_cls": "web.eligibility.models.ParticipantGroupEligibilityRequirement",
-                    "attributes": [
-                        {"id": "54ac6ea9fdf99b2204feb893", "value": True},
-                    ],
-                },
-            ],
-        )
+        result = _convert_eligibility_requirements(list(_ELIG_INPUT))
+        self.assertEqual(result, list(_ELIG_EXPECTED))
 
-    @patch("mephisto.abstractions.providers.prolific.api.workspaces.Workspaces.get_balance")
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_prolific_workspace")
-    def test_check_balance_success(self, mock__find_prolific_workspace, mock_get_balance, *args):
+    def test_check_balance_success(self, *args):
         expected_value = 9999
 
-        mock_workspace = Workspace()
-        mock_workspace.id = "test"
-        mock_workspacebalance = WorkspaceBalance()
-        mock_workspacebalance.available_balance = expected_value
+        mock_workspace = _workspace(id="test")
+        mock_workspacebalance = WorkspaceBalance(available_balance=expected_value)
 
-        mock__find_prolific_workspace.return_value = (True, mock_workspace)
-        mock_get_balance.return_value = mock_workspacebalance
+        self._set(prolific_utils, "_find_prolific_workspace", _returning((True, mock_workspace)))
+        self._set(Workspaces, "get_balance", _returning(mock_workspacebalance))
         balance = check_balance(self.client, workspace_name="test")
         self.assertEqual(expected_value, balance)
 
-    @patch("mephisto.abstractions.providers.prolific.api.workspaces.Workspaces.get_balance")
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_prolific_workspace")
     def test_check_balance_no_workspace_name(self, *args):
+        self._patch(prolific_utils, "_find_prolific_workspace")
+        self._patch(Workspaces, "get_balance")
         balance = check_balance(self.client)
         self.assertEqual(None, balance)
 
-    @patch("mephisto.abstractions.providers.prolific.api.workspaces.Workspaces.get_balance")
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_prolific_workspace")
-    def test_check_balance_found_no_workspace(self, mock__find_prolific_workspace, *args):
-        mock_workspace = Workspace()
-        mock_workspace.id = "test"
-
-        mock__find_prolific_workspace.return_value = (False, None)
+    def test_check_balance_found_no_workspace(self, *args):
+        self._patch(Workspaces, "get_balance")
+        self._set(prolific_utils, "_find_prolific_workspace", _returning((False, None)))
         balance = check_balance(self.client, workspace_name="test")
         self.assertEqual(None, balance)
 
-    @patch("mephisto.abstractions.providers.prolific.api.workspaces.Workspaces.get_balance")
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_prolific_workspace")
-    def test_check_balance_get_balance_exception(
-        self,
-        mock__find_prolific_workspace,
-        mock_get_balance,
-        *args,
-    ):
-        expected_value = 9999
-
-        mock_workspace = Workspace()
-        mock_workspace.id = "test"
-        mock_workspacebalance = WorkspaceBalance()
-        mock_workspacebalance.available_balance = expected_value
+    def test_check_balance_get_balance_exception(self, *args):
+        mock_workspace = _workspace(id="test")
+        self._set(prolific_utils, "_find_prolific_workspace", _returning((True, mock_workspace)))
 
-        mock__find_prolific_workspace.return_value = (True, mock_workspace)
-
-        exception_message = "Error"
-        mock_get_balance.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
+        self._set(Workspaces, "get_balance", _raising(_PROLIFIC_ERROR))
+        with pytest.raises(ProlificRequestError) as exc_info:
             check_balance(self.client, workspace_name="test")
+        self.assertEqual(exc_info.value.message, _PROLIFIC_ERROR.message)
 
-        self.assertEqual(cm.exception.message, exception_message)
-
-    @patch("mephisto.abstractions.providers.prolific.api.workspaces.Workspaces.retrieve")
-    def test__find_prolific_workspace_with_id_success(self, mock_retrieve, *args):
+    def test__find_prolific_workspace_with_id_success(self, *args):
         expected_id = "test"
         expected_title = "test"
 
-        mock_workspace = Workspace()
-        mock_workspace.id = expected_id
-        mock_workspace.title = expected_title
-
-        mock_retrieve.return_value = mock_workspace
+        mock_workspace = _workspace(id=expected_id, title=expected_title)
 
+        self._set(Workspaces, "retrieve", _returning(mock_workspace))
         result = _find_prolific_workspace(self.client, title="", id=expected_id)
         self.assertEqual((True, mock_workspace), result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.workspaces.Workspaces.retrieve")
-    def test__find_prolific_workspace_with_id_exception(self, mock_retrieve, *args):
+    def test__find_prolific_workspace_with_id_exception(self, *args):
         expected_id = "test"
 
-        exception_message = "Error"
-        mock_retrieve.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
+        self._set(Workspaces, "retrieve", _raising(_PROLIFIC_ERROR))
+        with pytest.raises(ProlificRequestError) as exc_info:
             _find_prolific_workspace(self.client, title="", id=expected_id)
+        self.assertEqual(exc_info.value.message, _PROLIFIC_ERROR.message)
 
-        self.assertEqual(cm.exception.message, exception_message)
-
-    @patch("mephisto.abstractions.providers.prolific.api.workspaces.Workspaces.list")
-    def test__find_prolific_workspace_with_title_success(self, mock_list, *args):
+    def test__find_prolific_workspace_with_title_success(self, *args):
         expected_title = "test"
 
-        mock_workspace = Workspace()
-        mock_workspace.title = expected_title
-
-        mock_list.return_value = [mock_workspace]
+        mock_workspace = _workspace(title=expected_title)
 
+        self._set(Workspaces, "list", _returning([mock_workspace]))
         result = _find_prolific_workspace(self.client, title=expected_title)
         self.assertEqual((True, mock_workspace), result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.workspaces.Workspaces.list")
-    def test__find_prolific_workspace_with_title_success_no_result(self, mock_list, *args):
+    def test__find_prolific_workspace_with_title_success_no_result(self, *args):
         expected_title = "test"
 
-        mock_workspace = Workspace()
-        mock_workspace.title = expected_title
-
-        mock_list.return_value = []
-
+        self._set(Workspaces, "list", _returning([]))
         result = _find_prolific_workspace(self.client, title=expected_title)
         self.assertEqual((False, None), result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.workspaces.Workspaces.list")
-    def test__find_prolific_workspace_with_title_exception(self, mock_list, *args):
+    def test__find_prolific_workspace_with_title_exception(self, *args):
         expected_title = "test"
 
-        exception_message = "Error"
-        mock_list.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
+        self._set(Workspaces, "list", _raising(_PROLIFIC_ERROR))
+        with pytest.raises(ProlificRequestError) as exc_info:
             _find_prolific_workspace(self.client, title=expected_title)
+        self.assertEqual(exc_info.value.message, _PROLIFIC_ERROR.message)
 
-        self.assertEqual(cm.exception.message, exception_message)
-
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_prolific_workspace")
-    def test_find_or_create_prolific_workspace_success_find(
-        self,
-        mock__find_prolific_workspace,
-        *args,
-    ):
+    def test_find_or_create_prolific_workspace_success_find(self, *args):
         expected_title = "test"
 
-        mock_workspace = Workspace()
-        mock_workspace.title = expected_title
-
-        mock__find_prolific_workspace.return_value = (True, mock_workspace)
+        mock_workspace = _workspace(title=expected_title)
 
+        self._set(
+            prolific_utils,
+            "_find_prolific_workspace",
+            _returning((True, mock_workspace)),
+        )
         result = find_or_create_prolific_workspace(self.client, expected_title)
-
         self.assertEqual(mock_workspace, result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.workspaces.Workspaces.create")
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_prolific_workspace")
-    def test_find_or_create_prolific_workspace_success_create(
-        self,
-        mock__find_prolific_workspace,
-        mock_create,
-        *args,
-    ):
+    def test_find_or_create_prolific_workspace_success_create(self, *args):
         expected_title = "test"
 
-        mock_workspace = Workspace()
-        mock_workspace.title = expected_title
-
-        mock__find_prolific_workspace.return_value = (False, None)
-        mock_create.return_value = mock_workspace
+        mock_workspace = _workspace(title=expected_title)
 
+        self._set(prolific_utils, "_find_prolific_workspace", _returning((False, None)))
+        self._set(Workspaces, "create", _returning(mock_workspace))
         result = find_or_create_prolific_workspace(self.client, expected_title)
-
         self.assertEqual(mock_workspace, result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.workspaces.Workspaces.create")
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_prolific_workspace")
-    def test_find_or_create_prolific_workspace_create_exception(
-        self,
-        mock__find_prolific_workspace,
-        mock_create,
-        *args,
-    ):
+    def test_find_or_create_prolific_workspace_create_exception(self, *args):
         expected_title = "test"
 
-        mock_workspace = Workspace()
-        mock_workspace.title = expected_title
-
-        mock__find_prolific_workspace.return_value = (False, None)
-
-        exception_message = "Error"
-        mock_create.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
+        self._set(prolific_utils, "_find_prolific_workspace", _returning((False, None)))
+        self._set(Workspaces, "create", _raising(_PROLIFIC_ERROR))
+        with pytest.raises(ProlificRequestError) as exc_info:
             find_or_create_prolific_workspace(self.client, expected_title)
+        self.assertEqual(exc_info.value.message, _PROLIFIC_ERROR.message)
 
-        self.assertEqual(cm.exception.message, exception_message)
-
-    @patch("mephisto.abstractions.providers.prolific.api.projects.Projects.list_for_workspace")
-    def test__find_prolific_project_success_with_title(self, mock_list_for_workspace, *args):
+    def test__find_prolific_project_success_with_title(self, *args):
         workspace_id = "test"
         project_title = "test2"
 
-        mock_project = Project()
-        mock_project.title = project_title
-
-        mock_list_for_workspace.return_value = [mock_project]
-
+        mock_project = _project(title=project_title)
+        self._set(Projects, "list_for_workspace", _returning([mock_project]))
         result = _find_prolific_project(self.client, workspace_id, project_title)
-
         self.assertEqual((True, mock_project), result)
         self.assertFalse(hasattr(mock_project, "id"))
 
-    @patch("mephisto.abstractions.providers.prolific.api.projects.Projects.list_for_workspace")
-    def test__find_prolific_project_success_with_id(self, mock_list_for_workspace, *args):
+    def test__find_prolific_project_success_with_id(self, *args):
         workspace_id = "test"
         project_title = "test2"
         project_id = "test3"
 
-        mock_project = Project()
-        mock_project.title = project_title
-        mock_project.id = project_id
-
-        mock_list_for_workspace.return_value = [mock_project]
-
+        mock_project = _project(id=project_id, title=project_title)
+        self._set(Projects, "list_for_workspace", _returning([mock_project]))
         result = _find_prolific_project(self.client, workspace_id, project_title, project_id)
-
         self.assertEqual((True, mock_project), result)
         self.assertTrue(hasattr(mock_project, "id"))
 
-    @patch("mephisto.abstractions.providers.prolific.api.projects.Projects.list_for_workspace")
-    def test__find_prolific_project_success_no_result(self, mock_list_for_workspace, *args):
+    def test__find_prolific_project_success_no_result(self, *args):
         workspace_id = "test"
         project_title = "test2"
 
-        mock_project = Project()
-        mock_project.title = project_title
-
-        mock_list_for_workspace.return_value = []
-
+        self._set(Projects, "list_for_workspace", _returning([]))
         result = _find_prolific_project(self.client, workspace_id, project_title)
-
         self.assertEqual((False, None), result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.projects.Projects.list_for_workspace")
-    def test__find_prolific_project_exception(self, mock_list_for_workspace, *args):
+    def test__find_prolific_project_exception(self, *args):
         workspace_id = "test"
         project_title = "test2"
 
-        exception_message = "Error"
-        mock_list_for_workspace.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
+        self._set(Projects, "list_for_workspace", _raising(_PROLIFIC_ERROR))
+        with pytest.raises(ProlificRequestError) as exc_info:
             _find_prolific_project(self.client, workspace_id, project_title)
+        self.assertEqual(exc_info.value.message, _PROLIFIC_ERROR.message)
 
-        self.assertEqual(cm.exception.message, exception_message)
-
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_prolific_project")
-    def test_find_or_create_prolific_project_success_find(self, mock__find_prolific_project, *args):
+    def test_find_or_create_prolific_project_success_find(self, *args):
         workspace_id = "test"
         project_title = "test2"
 
-        mock_project = Project()
-        mock_project.title = project_title
-
-        mock__find_prolific_project.return_value = (True, mock_project)
+        mock_project = _project(title=project_title)
 
+        self._set(prolific_utils, "_find_prolific_project", _returning((True, mock_project)))
         result = find_or_create_prolific_project(self.client, workspace_id, project_title)
-
         self.assertEqual(mock_project, result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.projects.Projects.create_for_workspace")
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_prolific_project")
-    def test_find_or_create_prolific_project_success_create(
-        self,
-        mock__find_prolific_project,
-        mock_create_for_workspace,
-        *args,
-    ):
+    def test_find_or_create_prolific_project_success_create(self, *args):
         workspace_id = "test"
         project_title = "test2"
 
-        mock_project = Project()
-        mock_project.title = project_title
-
-        mock__find_prolific_project.return_value = (False, None)
-        mock_create_for_workspace.return_value = mock_project
+        mock_project = _project(title=project_title)
 
+        self._set(prolific_utils, "_find_prolific_project", _returning((False, None)))
+        self._set(Projects, "create_for_workspace", _returning(mock_project))
         result = find_or_create_prolific_project(self.client, workspace_id, project_title)
-
         self.assertEqual(mock_project, result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.projects.Projects.create_for_workspace")
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_prolific_project")
-    def test_find_or_create_prolific_project_create_exception(
-        self,
-        mock__find_prolific_project,
-        mock_create_for_workspace,
-        *args,
-    ):
+    def test_find_or_create_prolific_project_create_exception(self, *args):
         workspace_id = "test"
         project_title = "test2"
 
-        mock__find_prolific_project.return_value = (False, None)
-
-        exception_message = "Error"
-        mock_create_for_workspace.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
+        self._set(prolific_utils, "_find_prolific_project", _returning((False, None)))
+        self._set(Projects, "create_for_workspace", _raising(_PROLIFIC_ERROR))
+        with pytest.raises(ProlificRequestError) as exc_info:
             find_or_create_prolific_project(self.client, workspace_id, project_title)
+        self.assertEqual(exc_info.value.message, _PROLIFIC_ERROR.message)
 
-        self.assertEqual(cm.exception.message, exception_message)
-
-    @patch(
-        "mephisto.abstractions.providers.prolific.api.participant_groups.ParticipantGroups.remove"
-    )
-    def test_delete_qualification_success(self, mock_remove, *args):
+    def test_delete_qualification_success(self, *args):
         prolific_participant_group_id = "test"
 
-        mock_remove.return_value = {}
+        self._set(ParticipantGroups, "remove", _returning({}))
 
         result = delete_qualification(self.client, prolific_participant_group_id)
 
         self.assertTrue(result)
 
-    @patch(
-        "mephisto.abstractions.providers.prolific.api.participant_groups.ParticipantGroups.remove"
-    )
-    def test_delete_qualification_exception(self, mock_remove, *args):
+    def test_delete_qualification_exception(self, *args):
         prolific_participant_group_id = "test"
 
-        exception_message = "Error"
-        mock_remove.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
+        self._set(ParticipantGroups, "remove", _raising(_PROLIFIC_ERROR))
+        with pytest.raises(ProlificRequestError) as exc_info:
             delete_qualification(self.client, prolific_participant_group_id)
+        self.assertEqual(exc_info.value.message, _PROLIFIC_ERROR.message)
 
-        self.assertEqual(cm.exception.message, exception_message)
-
-    @patch("mephisto.abstractions.providers.prolific.api.participant_groups.ParticipantGroups.list")
-    def test__find_qualification_success(self, mock_participant_groups_list, *args):
-        prolific_project_id = uuid4().hex[:24]
+    def test__find_qualification_success(self, *args):
+        prolific_project_id = _fake_id()
         qualification_name = "test"
         qualification_description = "test"
-        expected_qualification_id = uuid4().hex[:24]
-        mock_participant_groups_list.return_value = [
-            ParticipantGroup(
-                project_id=prolific_project_id,
-                id=expected_qualification_id,
-                name=qualification_name,
-                description=qualification_description,
-            )
-        ]
+
+        expected_qualification_id = _fake_id()
+        mock_participant_group = ParticipantGroup(
+            project_id=prolific_project_id,
+            id=expected_qualification_id,
+            name=qualification_name,
+            description=qualification_description,
+        )
+        self._set(ParticipantGroups, "list", _returning([mock_participant_group]))
         _, q = _find_qualification(self.client, prolific_project_id, qualification_name)
         self.assertEqual(q.id, expected_qualification_id)
 
-    @patch("mephisto.abstractions.providers.prolific.api.participant_groups.ParticipantGroups.list")
-    def test__find_qualification_no_qualification(self, mock_participant_groups_list, *args):
-        prolific_project_id = uuid4().hex[:24]
+    def test__find_qualification_no_qualification(self, *args):
+        prolific_project_id = _fake_id()
         qualification_name = "test"
-        mock_participant_groups_list.return_value = []
+
+        self._set(ParticipantGroups, "list", _returning([]))
         result = _find_qualification(self.client, prolific_project_id, qualification_name)
         self.assertEqual(result, (False, None))
 
-    @patch("mephisto.abstractions.providers.prolific.api.participant_groups.ParticipantGroups.list")
-    def test__find_qualification_error(self, mock_participant_groups_list, *args):
-        prolific_project_id = uuid4().hex[:24]
+    def test__find_qualification_error(self, *args):
+        prolific_project_id = _fake_id()
         qualification_name = "test"
-        exception_message = "Error"
-        mock_participant_groups_list.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
+
+        self._set(ParticipantGroups, "list", _raising(_PROLIFIC_ERROR))
+        with pytest.raises(ProlificRequestError) as exc_info:
             _find_qualification(self.client, prolific_project_id, qualification_name)
-        self.assertEqual(cm.exception.message, exception_message)
+        self.assertEqual(exc_info.value.message, _PROLIFIC_ERROR.message)
 
-    @patch(
-        "mephisto.abstractions.providers.prolific.api.participant_groups.ParticipantGroups.create"
-    )
-    def test_create_qualification_success(self, mock_create, *args):
+    def test_create_qualification_success(self, *args):
         prolific_project_id = "test"
         qualification_name = "test2"
         participant_group_id = "test3"
 
-        mock_participant_group = ParticipantGroup()
-        mock_participant_group.id = participant_group_id
-        mock_participant_group.name = qualification_name
-
-        mock_create.return_value = mock_participant_group
-
+        mock_participant_group = _participant_group(
+            id=participant_group_id,
+            name=qualification_name,
+        )
+        self._set(ParticipantGroups, "create", _returning(mock_participant_group))
         result = create_qualification(self.client, prolific_project_id, qualification_name)
-
         self.assertEqual(mock_participant_group, result)
 
-    @patch(
-        "mephisto.abstractions.providers.prolific.api.participant_groups.ParticipantGroups.create"
-    )
-    def test_create_qualification_exception(self, mock_create, *args):
+    def test_create_qualification_exception(self, *args):
         prolific_project_id = "test"
         qualification_name = "test2"
 
-        exception_message = "Error"
-        mock_create.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
+        self._set(ParticipantGroups, "create", _raising(_PROLIFIC_ERROR))
+        with pytest.raises(ProlificRequestError) as exc_info:
             create_qualification(self.client, prolific_project_id, qualification_name)
+        self.assertEqual(exc_info.value.message, _PROLIFIC_ERROR.message)
 
-        self.assertEqual(cm.exception.message, exception_message)
-
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_qualification")
-    def test_find_or_create_qualification_found_one(self, mock_find_qualification, *args):
-        prolific_project_id = uuid4().hex[:24]
+    def test_find_or_create_qualification_found_one(self, *args):
+        prolific_project_id = _fake_id()
         qualification_name = "test"
-        expected_qualification_id = uuid4().hex[:24]
-        expected_qualification = ParticipantGroup()
-        expected_qualification.id = expected_qualification_id
-        mock_find_qualification.return_value = (True, expected_qualification)
+
+        expected_qualification_id = _fake_id()
+        expected_qualification = _participant_group(id=expected_qualification_id)
+        self._set(
+            prolific_utils,
+            "_find_qualification",
+            _returning((True, expected_qualification)),
+        )
         result = find_or_create_qualification(
             self.client,
             prolific_project_id,
@@ -627,25 +630,18 @@ class TestProlificUtils(unittest.TestCase):
         )
         self.assertEqual(result.id, expected_qualification_id)
 
-    @patch(
-        "mephisto.abstractions.providers.prolific.api.participant_groups.ParticipantGroups.create"
-    )
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_qualification")
-    def test_find_or_create_qualification_created_new(
-        self,
-        mock_find_qualification,
-        mock_participant_groups_create,
-        *args,
-    ):
+    def test_find_or_create_qualification_created_new(self, *args):
         qualification_name = "test"
         qualification_description = "test"
-        expected_qualification_id = uuid4().hex[:24]
-        mock_find_qualification.return_value = (False, None)
-        mock_participant_groups_create.return_value = ParticipantGroup(
+
+        expected_qualification_id = _fake_id()
+        mock_participant_group = ParticipantGroup(
             id=expected_qualification_id,
             name=qualification_name,
             description=qualification_description,
         )
+        self._set(prolific_utils, "_find_qualification", _returning((False, None)))
+        self._set(ParticipantGroups, "create", _returning(mock_participant_group))
         result = find_or_create_qualification(
             self.client,
             qualification_name,
@@ -653,32 +649,22 @@ class TestProlificUtils(unittest.TestCase):
         )
         self.assertEqual(result.id, expected_qualification_id)
 
-    @patch(
-        "mephisto.abstractions.providers.prolific.api.participant_groups.ParticipantGroups.create"
-    )
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils._find_qualification")
-    def test_find_or_create_qualification_error(
-        self,
-        mock_find_qualification,
-        mock_participant_groups_create,
-        *args,
-    ):
+    def test_find_or_create_qualification_error(self, *args):
         qualification_name = "test"
         qualification_description = "test"
-        mock_find_qualification.return_value = (False, None)
-        exception_message = "Error"
-        mock_participant_groups_create.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
+
+        self._set(prolific_utils, "_find_qualification", _returning((False, None)))
+        self._set(ParticipantGroups, "create", _raising(_PROLIFIC_ERROR))
+        with pytest.raises(ProlificRequestError) as exc_info:
             find_or_create_qualification(
                 self.client,
                 qualification_name,
                 qualification_description,
             )
-        self.assertEqual(cm.exception.message, exception_message)
+        self.assertEqual(exc_info.value.message, _PROLIFIC_ERROR.message)
 
-    @patch("mephisto.abstractions.architects.ec2.ec2_architect.get_full_domain")
-    def test__ec2_external_url(self, mock_get_full_domain, *args):
-        mock_get_full_domain.return_value = "http://test.com"
+    def test__ec2_external_url(self, *args):
+        self._set(ec2_architect, "get_full_domain", _returning("http://test.com"))
 
         result = _ec2_external_url(mock_task_run_args)
 
@@ -692,22 +678,15 @@ class TestProlificUtils(unittest.TestCase):
 
     def test__is_ec2_architect(self, *args):
         result_local_architect = _is_ec2_architect(mock_task_run_args)
-
-        mock_task_run_args_ec2 = deepcopy(mock_task_run_args)
-        mock_task_run_args_ec2.architect._architect_type = "ec2"
         result_ec2_architect = _is_ec2_architect(mock_task_run_args_ec2)
 
         self.assertFalse(result_local_architect)
         self.assertTrue(result_ec2_architect)
 
-    @patch("mephisto.abstractions.architects.ec2.ec2_architect.get_full_domain")
-    def test__get_external_study_url(self, mock_get_full_domain, *args):
-        mock_get_full_domain.return_value = "http://test.com"
+    def test__get_external_study_url(self, *args):
+        self._set(ec2_architect, "get_full_domain", _returning("http://test.com"))
 
         result_local_architect = _get_external_study_url(mock_task_run_args)
-
-        mock_task_run_args_ec2 = deepcopy(mock_task_run_args)
-        mock_task_run_args_ec2.architect._architect_type = "ec2"
         result_ec2_architect = _get_external_study_url(mock_task_run_args_ec2)
 
         self.assertEqual(
@@ -722,226 +701,147 @@ class TestProlificUtils(unittest.TestCase):
             result_ec2_architect,
         )
 
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.update")
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.create")
-    def test_create_study_success(self, mock_study_create, mock_study_update, *args):
-        project_id = uuid4().hex[:24]
-        expected_study_id = uuid4().hex[:24]
+
+@pytest.mark.prolific
+@pytest.mark.usefixtures("prolific_client_class")
+class TestProlificStudyUtils(ProlificUtilsTestCase):
+    """Unit testing for Prolific Utils working with Studies"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Tests only read this one, a test that changes it works on its own copy
+        cls._base_study = Study(id="test", internal_name="test", total_available_places=0)
+
+    def setUp(self):
+        super().setUp()
+        # Every study test talks to `Studies`, so all its API calls are patched in one go.
+        # `create` clashes with the argument of `patch.multiple`, so it is patched on its own
+        self.mocks = self._stack.enter_context(
+            patch.multiple(
+                Studies,
+                update=DEFAULT,
+                retrieve=DEFAULT,
+                publish=DEFAULT,
+                stop=DEFAULT,
+            )
+        )
+        self.mocks["create"] = self._patch(Studies, "create")
+        # Tests import the real `get_study`, so this only replaces it inside other Prolific Utils
+        self.mocks["get_study"] = self._patch(prolific_utils, "get_study")
+
+    def _run_exception_case(self, fn, patched_target, *args, **kwargs):
+        """Check that `fn` re-raises the Prolific error coming from a patched API call"""
+        patched_target.side_effect = _raising(_PROLIFIC_ERROR)
+        with pytest.raises(ProlificRequestError) as exc_info:
+            fn(self.client, *args, **kwargs)
+        self.assertEqual(exc_info.value.message, _PROLIFIC_ERROR.message)
+
+    def test_create_study_success(self, *args):
         mock_study = Study(
-            project=project_id,
-            id=expected_study_id,
+            project=_FAKE_PROJECT_ID,
+            id=_FAKE_STUDY_ID,
             name="test",
-            completion_codes=[
-                dict(
-                    code="test",
-                    code_type="test",
-                    actions=[
-                        dict(
-                            action="test",
-                        )
-                    ],
-                )
-            ],
+            completion_codes=_COMPLETION_CODES,
         )
-        mock_study_create.return_value = mock_study
-        mock_study_update.return_value = mock_study
+        self.mocks["create"].return_value = mock_study
+        self.mocks["update"].return_value = mock_study
         study = create_study(
             client=self.client,
             task_run_config=mock_task_run_args,
-            prolific_project_id=project_id,
+            prolific_project_id=_FAKE_PROJECT_ID,
         )
-        self.assertEqual(study.id, expected_study_id)
-
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.update")
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.create")
-    def test_create_study_error(self, mock_study_create, *args):
-        project_id = uuid4().hex[:24]
-        exception_message = "Error"
-        mock_study_create.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
-            create_study(
-                client=self.client,
-                task_run_config=mock_task_run_args,
-                prolific_project_id=project_id,
-            )
-        self.assertEqual(cm.exception.message, exception_message)
-
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.update")
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils.get_study")
-    def test_increase_total_available_places_for_study_success(self, mock_get_study, *args):
-        study_id = "test"
-
-        mock_study = Study()
-        mock_study.id = study_id
-        mock_study.total_available_places = 0
-
-        mock_get_study.return_value = mock_study
-
-        result = increase_total_available_places_for_study(self.client, study_id)
-
-        self.assertEqual(mock_study, result)
-
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.update")
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils.get_study")
-    def test_increase_total_available_places_for_study_exception(
-        self,
-        mock_get_study,
-        mock_update,
-        *args,
-    ):
-        study_id = "test"
-
-        mock_study = Study()
-        mock_study.id = study_id
-        mock_study.total_available_places = 0
-
-        mock_get_study.return_value = mock_study
-
-        exception_message = "Error"
-        mock_update.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
-            increase_total_available_places_for_study(self.client, study_id)
-
-        self.assertEqual(cm.exception.message, exception_message)
-
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.retrieve")
-    def test_get_study_success(self, mock_retrieve, *args):
-        study_id = "test"
-
-        mock_study = Study()
-        mock_study.id = study_id
-
-        mock_retrieve.return_value = mock_study
-
-        result = get_study(self.client, study_id)
+        self.assertIs(mock_study, study)
 
-        self.assertEqual(mock_study, result)
-
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.retrieve")
-    def test_get_study_exception(self, mock_retrieve, *args):
-        study_id = "test"
-
-        mock_study = Study()
-        mock_study.id = study_id
-
-        exception_message = "Error"
-        mock_retrieve.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
-            get_study(self.client, study_id)
-
-        self.assertEqual(cm.exception.message, exception_message)
-
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.publish")
-    def test_publish_study_success(self, mock_publish, *args):
-        study_id = "test"
-
-        mock_study = Study()
-        mock_study.id = study_id
-
-        mock_publish.return_value = mock_study
-
-        result = publish_study(self.client, study_id)
-
-        self.assertEqual(study_id, result)
-
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.publish")
-    def test_publish_study_exception(self, mock_publish, *args):
-        study_id = "test"
+    def test_create_study_error(self, *args):
+        self._run_exception_case(
+            create_study,
+            self.mocks["create"],
+            task_run_config=mock_task_run_args,
+            prolific_project_id=_FAKE_PROJECT_ID,
+        )
 
-        mock_study = Study()
-        mock_study.id = study_id
+    def test_increase_total_available_places_for_study_success(self, *args):
+        mock_study = self._base_study
+        self.mocks["get_study"].return_value = mock_study
 
-        exception_message = "Error"
-        mock_publish.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
-            publish_study(self.client, study_id)
+        result = increase_total_available_places_for_study(self.client, mock_study.id)
 
-        self.assertEqual(cm.exception.message, exception_message)
+        self.assertIs(mock_study, result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.stop")
-    def test_stop_study_success(self, mock_stop, *args):
-        study_id = "test"
+    def test_increase_total_available_places_for_study_exception(self, *args):
+        mock_study = self._base_study
+        self.mocks["get_study"].return_value = mock_study
 
-        mock_study = Study()
-        mock_study.id = study_id
+        self._run_exception_case(
+            increase_total_available_places_for_study,
+            self.mocks["update"],
+            mock_study.id,
+        )
 
-        mock_stop.return_value = mock_study
+    def test_get_study_success(self, *args):
+        mock_study = self._base_study
+        self.mocks["retrieve"].return_value = mock_study
 
-        result = stop_study(self.client, study_id)
+        result = get_study(self.client, mock_study.id)
 
-        self.assertEqual(mock_study, result)
+        self.assertIs(mock_study, result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.stop")
-    def test_stop_study_exception(self, mock_stop, *args):
-        study_id = "test"
+    def test_get_study_exception(self, *args):
+        self._run_exception_case(get_study, self.mocks["retrieve"], self._base_study.id)
 
-        mock_study = Study()
-        mock_study.id = study_id
+    def test_publish_study_success(self, *args):
+        mock_study = self._base_study
+        self.mocks["publish"].return_value = mock_study
 
-        exception_message = "Error"
-        mock_stop.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
-            stop_study(self.client, study_id)
+        result = publish_study(self.client, mock_study.id)
 
-        self.assertEqual(cm.exception.message, exception_message)
+        self.assertEqual(mock_study.id, result)
 
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.update")
-    @patch("mephisto.abstractions.providers.prolific.api.studies.Studies.stop")
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils.get_study")
-    def test_expire_study_success(self, mock_get_study, mock_stop, *args):
-        study_id = "test"
+    def test_publish_study_exception(self, *args):
+        self._run_exception_case(publish_study, self.mocks["publish"], self._base_study.id)
 
-        mock_study = Study()
-        mock_study.id = study_id
-        mock_study.internal_name = "test"
+    def test_stop_study_success(self, *args):
+        mock_study = self._base_study
+        self.mocks["stop"].return_value = mock_study
 
-        mock_get_study.return_value = mock_study
-        mock_stop.return_value = mock_study
+        result = stop_study(self.client, mock_study.id)
 
-        result = expire_study(self.client, study_id)
+        self.assertIs(mock_study, result)
 
-        self.assertEqual(mock_study, result)
+    def test_stop_study_exception(self, *args):
+        self._run_exception_case(stop_study, self.mocks["stop"], self._base_study.id)
 
-    @patch("mephisto.abstractions.providers.prolific.prolific_utils.get_study")
-    def test_expire_study_exception(self, mock_get_study, *args):
-        study_id = "test"
+    def test_expire_study_success(self, *args):
+        mock_study = self._base_study
+        self.mocks["get_study"].return_value = mock_study
+        self.mocks["stop"].return_value = mock_study
 
-        mock_study = Study()
-        mock_study.id = study_id
+        result = expire_study(self.client, mock_study.id)
 
-        exception_message = "Error"
-        mock_get_study.side_effect = ProlificRequestError(exception_message)
-        with self.assertRaises(ProlificRequestError) as cm:
-            expire_study(self.client, study_id)
+        self.assertIs(mock_study, result)
 
-        self.assertEqual(cm.exception.message, exception_message)
+    def test_expire_study_exception(self, *args):
+        self._run_exception_case(expire_study, self.mocks["get_study"], self._base_study.id)
 
     def test_is_study_expired(self, *args):
-        study_id = "test"
-        study_name = "test"
-
-        mock_study = Study()
-        mock_study.id = study_id
-        mock_study.status = constants.StudyStatus.COMPLETED
-        mock_study.internal_name = study_name
-
-        result_just_with_completed_status = is_study_expired(mock_study)
-
-        mock_study.status = constants.StudyStatus.ACTIVE
-        result_with_any_other_status = is_study_expired(mock_study)
-
-        mock_study.status = constants.StudyStatus.AWAITING_REVIEW
-        result_just_with_awaiting_review_status = is_study_expired(mock_study)
-
-        mock_study.status = constants.StudyStatus.COMPLETED
-        mock_study.internal_name = study_name + "_" + constants.StudyStatus._EXPIRED
-        result_with_completed_status_and_internal_name = is_study_expired(mock_study)
-
-        self.assertFalse(result_just_with_completed_status)
-        self.assertFalse(result_with_any_other_status)
-        self.assertFalse(result_just_with_awaiting_review_status)
-        self.assertTrue(result_with_completed_status_and_internal_name)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        mock_study = copy(self._base_study)
+        study_name = mock_study.internal_name
+        Status = constants.StudyStatus
+
+        mock_study.status = Status.COMPLETED
+        with self.subTest(status=mock_study.status, internal_name=mock_study.internal_name):
+            self.assertFalse(is_study_expired(mock_study))
+
+        mock_study.status = Status.ACTIVE
+        with self.subTest(status=mock_study.status, internal_name=mock_study.internal_name):
+            self.assertFalse(is_study_expired(mock_study))
+
+        mock_study.status = Status.AWAITING_REVIEW
+        with self.subTest(status=mock_study.status, internal_name=mock_study.internal_name):
+            self.assertFalse(is_study_expired(mock_study))
+
+        mock_study.status = Status.COMPLETED
+        mock_study.internal_name = study_name + "_" + Status._EXPIRED
+        with self.subTest(status=mock_study.status, internal_name=mock_study.internal_name):
+            self.assertTrue(is_study_expired(mock_study))